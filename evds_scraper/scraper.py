@@ -2,16 +2,306 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import ElementNotInteractableException, NoSuchElementException
 from selenium.webdriver.remote.webelement import WebElement
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Union 
-import pandas as pd
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields, replace
+from functools import reduce
+from operator import attrgetter
+from pathlib import PurePath
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import base64
+import glob
+import io
 import json
+import logging
+import os
+import re
+import sys
+import tempfile
 import time
 
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+# Locators used throughout the scraper, built once at import time
+SEL_LANGUAGE_BUTTON = (By.ID, "languageBut")
+SEL_CATEGORY_PANEL = (By.CSS_SELECTOR, "h4.panel-title.serie-market-menu-category")
+SEL_CATEGORIES = (By.CSS_SELECTOR, "h4.panel-title.serie-market-menu-category a.accordion-toggle")
+SEL_SUBCATEGORIES = (By.CSS_SELECTOR, "a.serieMarketDataGroupItemLink")
+SEL_ITEM_ROWS = (By.CSS_SELECTOR, "tr.fcsable")
+SEL_ITEM_CHECKBOX = (By.CSS_SELECTOR, "input.checkboxes")
+SEL_ITEM_TEXT = (By.CSS_SELECTOR, "td.ws_enabled")
+SEL_CHECKED_ITEMS = (By.CSS_SELECTOR, "input.checkboxes:checked")
+SEL_CALC_DROPDOWN = (By.CSS_SELECTOR, "button.multiselect.dropdown-toggle")
+SEL_CALC_MENU = (By.CSS_SELECTOR, "ul.multiselect-container")
+SEL_CALC_TYPES = (By.CSS_SELECTOR, "ul.multiselect-container li")
+SEL_CALC_CHECKBOX = (By.CSS_SELECTOR, "input[type='checkbox']")
+SEL_CALC_LABEL = (By.CSS_SELECTOR, "label.checkbox")
+SEL_CHECKED_CALC_TYPES = (By.CSS_SELECTOR, "ul.multiselect-container li.active input[type='checkbox']")
+SEL_BODY = (By.TAG_NAME, "body")
+SEL_ADD_TO_CART = (By.CSS_SELECTOR, "a[href*='addToCart']")
+SEL_CART_COUNT = (By.CSS_SELECTOR, ".serieMarketCartCount")
+SEL_REPORT_BUTTON = (By.CLASS_NAME, "serieMarketReportButton")
+SEL_FREQUENCY = (By.ID, "frekansSelect")
+SEL_BEGIN_DATE_LABEL = (By.ID, "beginDateLabel")
+SEL_END_DATE_LABEL = (By.ID, "endDateLabel")
+SEL_BEGIN_DATE = (By.ID, "beginDate")
+SEL_END_DATE = (By.ID, "endDate")
+SEL_GRID = (By.CSS_SELECTOR, ".dx-datagrid")
+SEL_GRID_CONTENT = (By.CLASS_NAME, "dx-datagrid-content")
+SEL_HEADERS = (By.CSS_SELECTOR, "td[role='columnheader'] .dx-datagrid-text-content")
+SEL_SCROLL_CONTAINER = (By.CSS_SELECTOR, "div.dx-scrollable-container")
+SEL_ROWS = (By.CSS_SELECTOR, "tr.dx-row.dx-data-row")
+SEL_EXPLANATIONS_TAB = (By.ID, "tab_6_1_")
+SEL_EXPLANATION_SECTIONS = (By.CSS_SELECTOR, "#tab_6_1_ .col-md-12")
+SEL_EXPLANATION_CODE = (By.CSS_SELECTOR, ".col-md-4 h6 p")
+SEL_EXPLANATION_DESCRIPTION = (By.CSS_SELECTOR, ".col-md-4:nth-child(2) h6")
+SEL_EXPLANATION_TEXT = (By.CSS_SELECTOR, "p")
+SEL_EXPLANATION_INFO = (By.CSS_SELECTOR, "div[id^='infoD_']")
+SEL_EXCEL_BUTTON = (By.CSS_SELECTOR, "div#excelButton_")
+SEL_DOWNLOAD_BUTTON = (By.ID, "evdsDscModalButtonDownload")
+
+# Collects the visible rows matching arguments[0] in a single round trip. For each
+# row the clickable target (arguments[1]) and text holder (arguments[2]) are looked
+# up inside the row, or the row itself is used when the sub-selector is null. Targets
+# get a synthetic id so they can be resolved later with one find_element call; rows
+# without a target are still reported, with a null id.
+COLLECT_ROWS_JS = """
+var targetSelector = arguments[1], textSelector = arguments[2];
+return Array.from(document.querySelectorAll(arguments[0])).map(function (row) {
+    var target = targetSelector ? row.querySelector(targetSelector) : row;
+    var label = textSelector ? row.querySelector(textSelector) : row;
+    if (!label || !label.getClientRects().length) return null;
+    if (target && !target.id) target.id = 'evds_' + Math.random().toString(36).slice(2);
+    return {text: label.textContent.replace(/\\s+/g, ' ').trim(), id: target ? target.id : null};
+}).filter(Boolean);
+"""
+
+# Clicks every element matching arguments[0]
+CLICK_ALL_JS = """
+document.querySelectorAll(arguments[0]).forEach(function (el) { el.click(); });
+"""
+
+# Returns the trimmed text of every element matching arguments[0]
+COLLECT_TEXTS_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).map(function (el) {
+    return el.textContent.trim();
+});
+"""
+
+# Returns [value, text] for every option of the select element arguments[0]
+SELECT_OPTIONS_JS = """
+return Array.from(arguments[0].options).map(function (option) {
+    return [option.value, option.text.trim()];
+});
+"""
+
+# Sets the value of the select element arguments[0] and notifies its listeners
+SET_SELECT_VALUE_JS = """
+arguments[0].value = arguments[1];
+arguments[0].dispatchEvent(new Event('change'));
+"""
+
+# Returns the first element matching arguments[0] whose text equals arguments[1],
+# else the first whose text contains it or is contained in it, else null
+FIND_BY_TEXT_JS = """
+var text = arguments[1];
+var elements = Array.from(document.querySelectorAll(arguments[0]));
+function textOf(element) { return element.textContent.trim(); }
+return elements.find(function (element) { return textOf(element) === text; }) ||
+    elements.find(function (element) {
+        var candidate = textOf(element);
+        return candidate.indexOf(text) !== -1 || text.indexOf(candidate) !== -1;
+    }) || null;
+"""
+
+# Returns [row index, cell texts] for every rendered row matching arguments[0].
+# The index is the grid's aria-rowindex, or null when the grid does not set it.
+COLLECT_CELLS_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).map(function (row) {
+    var index = parseInt(row.getAttribute('aria-rowindex'), 10);
+    return [isNaN(index) ? null : index, Array.from(row.querySelectorAll('td')).map(function (cell) {
+        return cell.textContent.trim();
+    })];
+});
+"""
+
+# Selectors passed to collectExplanations, in argument order
+EXPLANATION_SELECTORS = [
+    SEL_EXPLANATION_SECTIONS[1],
+    SEL_EXPLANATION_CODE[1],
+    SEL_EXPLANATION_DESCRIPTION[1],
+    SEL_EXPLANATION_TEXT[1],
+    SEL_EXPLANATION_INFO[1]
+]
+
+# Reads the code, description and additional info of every explanation section
+# given the EXPLANATION_SELECTORS. Hidden elements read as empty text, as
+# WebElement.text does. Sections missing a part are returned as null.
+EXPLANATIONS_FUNCTION_JS = """
+function collectExplanations(sectionSelector, codeSelector, containerSelector, descriptionSelector, infoSelector) {
+    function visibleText(element) {
+        return element.getClientRects().length ? element.innerText.trim() : '';
+    }
+    return Array.from(document.querySelectorAll(sectionSelector)).map(function (section) {
+        var code = section.querySelector(codeSelector);
+        var container = section.querySelector(containerSelector);
+        var description = container && container.querySelector(descriptionSelector);
+        var info = container && container.querySelector(infoSelector);
+        if (!code || !description || !info) return null;
+        return {code: visibleText(code), description: visibleText(description), info: visibleText(info)};
+    });
+}
+"""
+
+COLLECT_EXPLANATIONS_JS = EXPLANATIONS_FUNCTION_JS + """
+return collectExplanations.apply(null, arguments);
+"""
+
+# Selectors passed to the report harvester as arguments[3], in this order
+GRID_SELECTORS = [
+    SEL_GRID[1],
+    SEL_SCROLL_CONTAINER[1],
+    SEL_HEADERS[1],
+    SEL_ROWS[1]
+]
+
+# Finds the DevExtreme dxDataGrid instance of the grid element matching the
+# selector, or null when neither the DevExpress nor the jQuery API exposes it.
+FIND_GRID_FUNCTION_JS = """
+function findGrid(gridSelector) {
+    var element = document.querySelector(gridSelector);
+    for (; element; element = element.parentElement) {
+        var grid = null;
+        try {
+            if (window.DevExpress && DevExpress.ui && DevExpress.ui.dxDataGrid) {
+                grid = DevExpress.ui.dxDataGrid.getInstance(element);
+            }
+            if (!grid && window.jQuery) grid = jQuery(element).data('dxDataGrid');
+        } catch (e) {}
+        if (grid) return grid;
+    }
+    return null;
+}
+"""
+
+# Returns the total number of report rows known to the grid, or null when the
+# grid instance is not reachable or doesn't know the total yet.
+GRID_TOTAL_COUNT_JS = FIND_GRID_FUNCTION_JS + """
+var grid = findGrid(arguments[0]);
+try {
+    var total = grid ? grid.totalCount() : -1;
+    return total >= 0 ? total : null;
+} catch (e) {
+    return null;
+}
+"""
+
+# Harvests the DevExtreme data grid located by the GRID_SELECTORS inside the
+# browser. Rows are keyed by their row index, falling back to the date. When
+# the grid instance is reachable its paging API is used to jump page by page;
+# otherwise the scroll container is moved one viewport at a time, yielding to
+# the page between steps so the grid can render.
+# Stops when the begin date (arguments[0] or its alternative arguments[1]) is
+# found or there is nothing left to load, then returns {columns, rows, found}.
+# When arguments[2] holds the EXPLANATION_SELECTORS the explanation sections are
+# read in the same call and returned as `explanations`.
+HARVEST_REPORT_JS = EXPLANATIONS_FUNCTION_JS + FIND_GRID_FUNCTION_JS + """
+var beginDate = arguments[0], alternativeDate = arguments[1];
+var explanationSelectors = arguments[2];
+var gridSelector = arguments[3][0], containerSelector = arguments[3][1];
+var headerSelector = arguments[3][2], rowSelector = arguments[3][3];
+var done = arguments[arguments.length - 1];
+var settleMs = 1000;
+var container = document.querySelector(containerSelector);
+var columns = Array.from(document.querySelectorAll(headerSelector))
+    .map(function (header) { return header.textContent.trim(); });
+var seen = {}, rows = [], found = false;
+
+function harvest() {
+    var rendered = document.querySelectorAll(rowSelector);
+    for (var i = 0; i < rendered.length; i++) {
+        var cells = Array.from(rendered[i].querySelectorAll('td')).map(function (cell) {
+            return cell.textContent.trim();
+        });
+        var date = cells[0];
+        // Key rows by the grid's row index, falling back to the date text
+        var key = rendered[i].getAttribute('aria-rowindex') || date;
+        if (!date || seen[key] || cells.length < columns.length) continue;
+        seen[key] = true;
+        rows.push(cells.slice(0, columns.length));
+        if (date === beginDate || date === alternativeDate) {
+            found = true;
+            return true;
+        }
+    }
+    return false;
+}
 
-
-@dataclass
+function finish() {
+    var result = {columns: columns, rows: rows, found: found};
+    if (explanationSelectors) {
+        result.explanations = collectExplanations.apply(null, explanationSelectors);
+    }
+    done(result);
+}
+
+function pageStep(grid, pageIndex, pageCount) {
+    if (harvest() || pageIndex >= pageCount) return finish();
+    Promise.resolve(grid.pageIndex(pageIndex)).then(function () {
+        requestAnimationFrame(function () { pageStep(grid, pageIndex + 1, pageCount); });
+    }, function () {
+        scrollStep();
+    });
+}
+
+function scrollStep() {
+    if (harvest() || !container) return finish();
+    var top = container.scrollTop, count = rows.length, started = Date.now();
+    container.scrollTop += container.clientHeight;
+    (function settle() {
+        requestAnimationFrame(function () {
+            if (harvest()) return finish();
+            if (rows.length > count) return scrollStep();
+            if (Date.now() - started < settleMs) return settle();
+            // Nothing new was rendered and the container did not move: end of grid
+            if (container.scrollTop === top) return finish();
+            scrollStep();
+        });
+    })();
+}
+
+var grid = findGrid(gridSelector);
+var pageCount = 0;
+try {
+    // Infinite scrolling has no fixed page count, so it is walked by scrolling
+    if (grid && grid.option('scrolling.mode') !== 'infinite') pageCount = grid.pageCount();
+} catch (e) {}
+if (pageCount > 1) {
+    pageStep(grid, 0, pageCount);
+} else {
+    scrollStep();
+}
+"""
+
+
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_OPTIONS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Variable:
     """Structure for variable definition"""
     category: str
@@ -20,8 +310,18 @@ class Variable:
     calculation_type: str
 
 
+# Variable field names and a getter for their values, used to build plain dicts
+# without the recursive copying done by dataclasses.asdict
+_VARIABLE_FIELDS = tuple(field.name for field in fields(Variable))
+_variable_values = attrgetter(*_VARIABLE_FIELDS)
+
+
+def _variable_to_dict(variable: Variable) -> Dict[str, str]:
+    """Convert a Variable to a plain dict"""
+    return dict(zip(_VARIABLE_FIELDS, _variable_values(variable)))
+
         
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ScraperConfig:
     """Configuration for EVDS Scraper"""
     language: str = "english"
@@ -31,6 +331,13 @@ class ScraperConfig:
     frequency: Optional[str] = None
     begin_date: Optional[str] = None
     end_date: Optional[str] = None
+    # Read table data from the JSON response behind the report grid instead of the
+    # rendered grid. Needs a Chromium driver with performance logging enabled. Columns
+    # come back under the endpoint's raw keys, not the grid's column labels.
+    use_data_endpoint: bool = False
+    # Directory the browser saves Excel exports to. When set, save_as_excel waits for
+    # the file to land there instead of sleeping a fixed delay.
+    download_dir: Optional[str] = None
         
     def is_date_mode_automatic(self) -> bool:
         """Check if we should use automatic date mode"""
@@ -39,6 +346,9 @@ class ScraperConfig:
                 self.end_date is not None])
 
 class EVDSScraper:
+
+    __slots__ = ("driver", "wait", "fast_wait", "export_wait", "config", "pool_size", "selected_variables",
+                 "_last_item_texts")
     
     FREQUENCIES = {
         'daily': 'Date',
@@ -59,37 +369,140 @@ class EVDSScraper:
         'SEMIYEAR': 'S[1-2]-YYYY',
         'YEAR': 'YYYY'
     }
+
+    # Patterns matching DATE_FORMATS, compiled once
+    _DATE_REGEXES = {
+        'Date': re.compile(r'^\d{2}-\d{2}-\d{4}$'),
+        'WORKDAY': re.compile(r'^\d{2}-\d{2}-\d{4}$'),
+        'YEARWEEK': re.compile(r'^\d{2}-\d{2}-\d{4}$'),
+        'MONTH': re.compile(r'^\d{2}-\d{4}$'),
+        'QUARTER': re.compile(r'^Q[1-4]-\d{4}$'),
+        'SEMIYEAR': re.compile(r'^S[1-2]-\d{4}$'),
+        'YEAR': re.compile(r'^\d{4}$')
+    }
+
+    # Seconds allowed for in-browser scripts such as the grid harvester
+    SCRIPT_TIMEOUT = 120
+
+    # Buffer size used when writing exported configuration files
+    EXPORT_BUFFER_SIZE = 64 * 1024
+
+    # localStorage key remembering the variables added to the site's cart
+    CART_STORAGE_KEY = "evds_cart"
+
+    # Keep-alive connections kept open to the driver server
+    CONNECTION_POOL_SIZE = 32
     
-    def __init__(self, driver, config: Optional[ScraperConfig] = None):
+    def __init__(self, driver, config: Optional[ScraperConfig] = None, pool_size: int = 1):
+        """
+        Args:
+            driver: Selenium webdriver used for the session. A headless Chrome
+                without images loads pages noticeably faster, see build_driver().
+            config: Scraper configuration, defaults to ScraperConfig()
+            pool_size: Number of browser sessions used to process config.variables
+                concurrently. Extra sessions are created with build_driver().
+        """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WebDriverWait(driver, 10, poll_frequency=0.2)
+        self.fast_wait = WebDriverWait(driver, 1, poll_frequency=0.05)
+        self.export_wait = WebDriverWait(
+            driver, 15, poll_frequency=0.1,
+            ignored_exceptions=(NoSuchElementException, ElementNotInteractableException)
+        )
         self.config = config or ScraperConfig()
-        self.selected_variables = []
+        self.pool_size = max(1, pool_size)
+        self.selected_variables: List[Variable] = []
+        self._last_item_texts = []
+        self._tune_connection_pool()
         self.initialize_session()
 
-    def safe_click(self, element):
-        """Safely click element"""
-        self.driver.execute_script("arguments[0].click();", element)
-        time.sleep(0.5)  # Small delay for stability
+    def _tune_connection_pool(self):
+        """Replace the driver's HTTP connection pool with a larger, non-blocking keep-alive pool"""
+        try:
+            executor = self.driver.command_executor
+            if getattr(executor, "_conn", None) is None:
+                return  # keep-alive disabled, connections are not pooled
+
+            pool_args = {"init_args_for_pool_manager": {"maxsize": self.CONNECTION_POOL_SIZE, "block": False}}
+            client_config = getattr(executor, "_client_config", None)
+            if client_config is not None:
+                client_config.init_args_for_pool_manager = pool_args  # selenium >= 4.26
+            else:
+                executor._init_args_for_pool_manager = pool_args
+
+            executor._conn.clear()
+            executor._conn = executor._get_connection_manager()
+        except Exception as e:
+            print(f"Could not resize driver connection pool: {e}")
+
+    def safe_click(self, element, wait_for: Optional[Callable] = None, replaces: Optional[WebElement] = None):
+        """
+        Safely click element, optionally waiting for a condition afterwards
 
-    def wait_for_element(self, by, value, timeout: int = 5):
-        """Wait for element with timeout"""
+        Args:
+            element: Element to click
+            wait_for: Condition that must hold after the click
+            replaces: Element the click is expected to re-render. Checked briefly before
+                wait_for, so content left over from an earlier selection can't satisfy it.
+        """
+        self.driver.execute_script("arguments[0].click();", element)
+        if replaces is not None:
+            # Not every click re-renders the same nodes, so continue after the short wait
+            self.wait_for_condition(EC.staleness_of(replaces), timeout=1)
+        if wait_for is not None:
+            self.wait.until(wait_for)
+
+    def _first_element(self, locator: Tuple[str, str]) -> Optional[WebElement]:
+        """Return the first element currently matching locator without waiting"""
+        elements = self.driver.find_elements(*locator)
+        return elements[0] if elements else None
+
+    def _get_wait(self, timeout: Optional[float] = None) -> WebDriverWait:
+        """Get the cached default or short wait, or build one for other timeouts"""
+        if timeout is None:
+            return self.wait
+        if timeout <= 1:
+            return self.fast_wait
+        return WebDriverWait(self.driver, timeout, poll_frequency=0.2)
+
+    def wait_for_element(self, by, value: Optional[str] = None, timeout: Optional[float] = None):
+        """Wait for element with timeout, given either (by, value) or a locator tuple"""
+        locator = by if value is None else (by, value)
         try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
+            return self._get_wait(timeout).until(
+                EC.presence_of_element_located(locator)
             )
         except Exception as e:
             return None
 
-    def wait_for_elements(self, by, value, timeout: int = 5):
-        """Wait for elements with timeout"""
+    def wait_for_elements(self, by, value: Optional[str] = None, timeout: Optional[float] = None):
+        """Wait for elements with timeout, given either (by, value) or a locator tuple"""
+        locator = by if value is None else (by, value)
         try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_all_elements_located((by, value))
+            return self._get_wait(timeout).until(
+                EC.presence_of_all_elements_located(locator)
             )
         except Exception as e:
             return []
 
+    def wait_for_condition(self, condition: Callable, timeout: Optional[float] = None):
+        """Wait for an arbitrary condition with timeout"""
+        try:
+            return self._get_wait(timeout).until(condition)
+        except Exception:
+            return None
+
+    def _collect_rows(self, rows: Tuple[str, str], target: Optional[Tuple[str, str]] = None,
+                      text: Optional[Tuple[str, str]] = None) -> List[Dict]:
+        """Collect text and element id of visible rows with one script call (CSS locators only)"""
+        return self.driver.execute_script(
+            COLLECT_ROWS_JS, rows[1], target[1] if target else None, text[1] if text else None
+        )
+
+    def _element_by_id(self, element_id: str) -> WebElement:
+        """Resolve an element collected by _collect_rows"""
+        return self.driver.find_element(By.ID, element_id)
+
     def get_user_choice(self, max_value: int, start_from_one: bool = True) -> int:
         """Get validated user choice"""
         base = 1 if start_from_one else 0
@@ -105,23 +518,32 @@ class EVDSScraper:
     def initialize_session(self):
         """Initialize session and set language"""
         self.driver.get('https://evds2.tcmb.gov.tr/index.php?/evds/serieMarket')
-        time.sleep(2)
 
-        lang_button = self.wait_for_element(By.ID, "languageBut")
-        current_lang = lang_button.text.strip()
+        lang_button = self.wait.until(EC.presence_of_element_located(SEL_LANGUAGE_BUTTON))
+        current_lang = self._get_language_label()
         
         if (self.config.language.lower() == "english" and current_lang == "EN") or \
         (self.config.language.lower() == "turkish" and current_lang == "TR"):
-            self.safe_click(lang_button)
-            time.sleep(2)
+            self.safe_click(lang_button, wait_for=lambda d: self._get_language_label() not in (None, current_lang))
 
+    def _get_language_label(self) -> Optional[str]:
+        """Read the language button label, None while the page is reloading"""
+        try:
+            return self.driver.execute_script(
+                "var button = document.getElementById(arguments[0]); return button ? button.textContent.trim() : null;",
+                SEL_LANGUAGE_BUTTON[1]
+            )
+        except Exception:
+            return None
 
-    def _get_elements(self, selector: str, parent_element: WebElement = None, timeout = 5) -> List[WebElement]:
-        """Helper method to fetch elements using a CSS selector"""
+
+    def _get_elements(self, selector: Union[str, Tuple[str, str]], parent_element: WebElement = None, timeout = None) -> List[WebElement]:
+        """Helper method to fetch elements using a CSS selector or a locator tuple"""
+        locator = (By.CSS_SELECTOR, selector) if isinstance(selector, str) else selector
         try:
             if parent_element:
-                return parent_element.find_elements(By.CSS_SELECTOR, selector)
-            return self.wait_for_elements(By.CSS_SELECTOR, selector, timeout)
+                return parent_element.find_elements(*locator)
+            return self.wait_for_elements(locator, timeout=timeout)
         except Exception as e:
             print(f"Error fetching elements with selector {selector}: {e}")
             return []
@@ -130,23 +552,26 @@ class EVDSScraper:
                     selector_value: Union[str, int], 
                     elements: List[Union[WebElement, Dict]], 
                     get_text_fn: Callable,
-                    click_fn: Callable) -> Optional[str]:
-        """Generic base method for all selections"""
+                    click_fn: Callable,
+                    find_fn: Optional[Callable] = None) -> Optional[str]:
+        """Generic base method for all selections, find_fn optionally resolves text selectors directly"""
         try:
             selected = None
-            if isinstance(selector_value, str):
-                
+            if isinstance(selector_value, str) and find_fn:
+                selected = find_fn(selector_value)
+
+            elif isinstance(selector_value, str):
+                texts = [get_text_fn(element) for element in elements]
+
                 # Try exact match first
-                for element in elements:
-                    text = get_text_fn(element)
+                for element, text in zip(elements, texts):
                     if selector_value == text:
                         selected = element
                         break
 
                 # If no exact match, try contained match
                 if not selected:
-                    for element in elements:
-                        text = get_text_fn(element)
+                    for element, text in zip(elements, texts):
                         if selector_value in text or text in selector_value:
                             selected = element
                             break
@@ -166,7 +591,8 @@ class EVDSScraper:
     def _select_category_base(self, category_selector: Union[str, int], categories: List[WebElement]) -> Optional[str]:
         """Base method for category selection"""
         def get_text(element: WebElement) -> str:
-            return element.text
+            # Raw text is enough for matching and skips the visibility computation of .text
+            return element.get_property('textContent').strip()
 
         def handle_click(element: WebElement) -> str:
             category_code = element.get_attribute('categorycode')
@@ -174,13 +600,16 @@ class EVDSScraper:
             is_expanded = panel.get_attribute("class").find("in") != -1
 
             if not is_expanded:
-                self.safe_click(element)
-                self.wait.until(
-                    EC.visibility_of_element_located((By.CSS_SELECTOR, f"#collapse_{category_code}"))
-                )
+                self.safe_click(element, wait_for=EC.visibility_of_element_located(
+                    (By.CSS_SELECTOR, f"#collapse_{category_code} {SEL_SUBCATEGORIES[1]}")
+                ))
             return element.text
 
-        return self._select_base(category_selector, categories, get_text, handle_click)
+        def find(text: str) -> Optional[WebElement]:
+            # Match inside the page instead of reading every category text
+            return self.driver.execute_script(FIND_BY_TEXT_JS, SEL_CATEGORIES[1], text)
+
+        return self._select_base(category_selector, categories, get_text, handle_click, find)
 
     def _select_subcategory_base(self, subcategory_selector: Union[str, int], subcategories: List[Dict]) -> Optional[str]:
         """Base method for subcategory selection"""
@@ -188,7 +617,10 @@ class EVDSScraper:
             return element['text']
 
         def handle_click(element: Dict) -> str:
-            self.safe_click(element['element'])
+            # Wait for the item table of the subcategory to replace the previous one
+            self.safe_click(self._element_by_id(element['id']), wait_for=EC.visibility_of_element_located(
+                SEL_ITEM_ROWS
+            ), replaces=self._first_element(SEL_ITEM_ROWS))
             return element['text']
 
         return self._select_base(subcategory_selector, subcategories, get_text, handle_click)
@@ -199,7 +631,10 @@ class EVDSScraper:
             return element['text']
 
         def handle_click(element: Dict) -> str:
-            self.safe_click(element['checkbox'])
+            # Wait for the calculation types of the item to replace the previous ones
+            self.safe_click(self._element_by_id(element['id']), wait_for=EC.element_to_be_clickable(
+                SEL_CALC_DROPDOWN
+            ), replaces=self._first_element(SEL_CALC_TYPES))
             return element['text']
 
         return self._select_base(item_selector, items, get_text, handle_click)
@@ -210,66 +645,43 @@ class EVDSScraper:
             return element['text']
 
         def handle_click(element: Dict) -> str:
-            self.safe_click(element['checkbox'])
-            self.safe_click(self.driver.find_element(By.TAG_NAME, "body"))  # Close dropdown
+            self.safe_click(self._element_by_id(element['id']))
+            self.safe_click(self.driver.find_element(*SEL_BODY))  # Close dropdown
             return element['text']
 
         return self._select_base(calc_type_selector, calc_types, get_text, handle_click)
 
     def _get_valid_subcategories(self) -> List[Dict]:
         """Helper method to get valid subcategories"""
-        subcategories = self._get_elements("a.serieMarketDataGroupItemLink")
-        return [{'text': subcat.text.strip(), 'element': subcat} 
-                for subcat in subcategories 
-                if subcat.text.strip()]
+        subcategories = self._collect_rows(SEL_SUBCATEGORIES)
+        return [subcat for subcat in subcategories if subcat['text']]
 
     def _get_valid_items(self) -> List[Dict]:
         """Helper method to get valid items"""
         # Clear previous selections
-        checked_items = self._get_elements("input.checkboxes:checked")
-        for item in checked_items:
-            self.safe_click(item)
+        self.driver.execute_script(CLICK_ALL_JS, SEL_CHECKED_ITEMS[1])
 
-        items = []
-        rows = self._get_elements("tr.fcsable",None,0.1)
-        for row in rows:
-            try:
-                checkbox = row.find_element(By.CSS_SELECTOR, "input.checkboxes")
-                text_cell = row.find_element(By.CSS_SELECTOR, "td.ws_enabled")
-                items.append({
-                    'text': text_cell.text,
-                    'checkbox': checkbox
-                })
-            except:
-                continue
-        return items
+        rows = self._collect_rows(SEL_ITEM_ROWS, SEL_ITEM_CHECKBOX, SEL_ITEM_TEXT)
+        # Keep every row text so failures can be reported without querying again
+        self._last_item_texts = [row['text'] for row in rows]
+        return [row for row in rows if row['id']]
 
     def _get_valid_calc_types(self) -> List[Dict]:
         """Helper method to get valid calculation types"""
         # Open dropdown
-        dropdown = self.wait_for_element(By.CSS_SELECTOR, "button.multiselect.dropdown-toggle")
-        self.safe_click(dropdown)
+        dropdown = self.wait_for_element(SEL_CALC_DROPDOWN)
+        self.safe_click(dropdown, wait_for=EC.visibility_of_element_located(SEL_CALC_MENU))
 
         # Clear previous selections
-        checked = self._get_elements("ul.multiselect-container li.active input[type='checkbox']")
-        for item in checked:
-            self.safe_click(item)
-
-        calc_types = []
-        type_elements = self._get_elements("ul.multiselect-container li")
-        for calc_type in type_elements:
-            label = calc_type.find_element(By.CSS_SELECTOR, "label.checkbox")
-            checkbox = calc_type.find_element(By.CSS_SELECTOR, "input[type='checkbox']")
-            calc_types.append({
-                'text': label.text,
-                'checkbox': checkbox
-            })
-        return calc_types
+        self.driver.execute_script(CLICK_ALL_JS, SEL_CHECKED_CALC_TYPES[1])
+
+        calc_types = self._collect_rows(SEL_CALC_TYPES, SEL_CALC_CHECKBOX, SEL_CALC_LABEL)
+        return [calc_type for calc_type in calc_types if calc_type['id']]
 
     def select_category(self) -> Optional[str]:
         """Interactive category selection"""
         try:
-            categories = self._get_elements("h4.panel-title.serie-market-menu-category a.accordion-toggle")
+            categories = self._get_elements(SEL_CATEGORIES)
             print("\nAvailable Categories:")
             for i, category in enumerate(categories, 1):
                 print(f"{i}. {category.text}")
@@ -324,19 +736,38 @@ class EVDSScraper:
     
     def add_to_cart(self):
         """Add current selection to cart"""
-        add_button = self.wait_for_element(By.CSS_SELECTOR, "a[href*='addToCart']")
+        add_button = self.wait_for_element(SEL_ADD_TO_CART)
+        # The cart no longer matches any stored list once it changes
+        self._clear_cart()
+        count = self._cart_count()
+        if count is None:
+            # No cart badge to watch, settle briefly on the button being re-rendered
+            self.safe_click(add_button, replaces=add_button)
+            return
+
         self.safe_click(add_button)
-        time.sleep(1)
+        # Adding a series that is already in the cart leaves the count as it is, so don't fail
+        if self.wait_for_condition(lambda d: (self._cart_count() or 0) > count) is None:
+            print("Cart count did not change after adding the variable")
+
+    def _cart_count(self) -> Optional[int]:
+        """Read the number of series in the cart from its badge, None when there is no badge"""
+        badge = self._first_element(SEL_CART_COUNT)
+        if badge is None:
+            return None
+        digits = re.sub(r'\D', '', badge.get_property('textContent') or '')
+        return int(digits) if digits else 0
     
     def create_report(self):
         """Create report"""
-        report_button = self.wait_for_element(By.CLASS_NAME, "serieMarketReportButton")
-        self.safe_click(report_button)
-        time.sleep(2)
+        report_button = self.wait_for_element(SEL_REPORT_BUTTON)
+        if self.config.use_data_endpoint:
+            self._drain_performance_log()
+        self.safe_click(report_button, wait_for=EC.presence_of_element_located(SEL_GRID_CONTENT))
     
     def _get_category_elements(self) -> List[WebElement]:
         """Get category elements"""
-        return self._get_elements("h4.panel-title.serie-market-menu-category a.accordion-toggle")
+        return self._get_elements(SEL_CATEGORIES)
 
     def process_single_variable(self, variable: Variable) -> bool:
         """Process a single variable with error handling"""
@@ -355,7 +786,6 @@ class EVDSScraper:
             if not self._select_category_base(variable.category, categories):
                 print(f"Failed to select category: '{variable.category}'")
                 return False
-            time.sleep(1)  # Wait for subcategories to load
 
             # Step 2: Select Subcategory
             subcategories = self._get_valid_subcategories()
@@ -366,25 +796,18 @@ class EVDSScraper:
             if not self._select_subcategory_base(variable.subcategory, subcategories):
                 print(f"Failed to select subcategory: '{variable.subcategory}'")
                 return False
-            time.sleep(2)  # Increased wait time for items to load
 
             # Step 3: Select Item
             items = self._get_valid_items()
             if not items:
                 print("Failed to get items. Available items:")
-                rows = self._get_elements("tr.fcsable")
-                for row in rows:
-                    try:
-                        text_cell = row.find_element(By.CSS_SELECTOR, "td.ws_enabled")
-                        print(f"- {text_cell.text}")
-                    except:
-                        continue
+                for text in self._last_item_texts:
+                    print(f"- {text}")
                 return False
 
             if not self._select_item_base(variable.item_name, items):
                 print(f"Failed to select item: '{variable.item_name}'")
                 return False
-            time.sleep(1)  # Wait for calculation types to load
 
             # Step 4: Select Calculation Type
             calc_types = self._get_valid_calc_types()
@@ -408,29 +831,85 @@ class EVDSScraper:
         if not self.config.variables:
             return False
 
-        success_count = 0
+        processed = []
         total_vars = len(self.config.variables)
         
         for i, variable in enumerate(self.config.variables, 1):
             print(f"\nProcessing variable {i}/{total_vars}")
             if self.process_single_variable(variable):
-                success_count += 1
+                processed.append(variable)
                 print(f"Successfully processed {variable.item_name}")
             else:
                 print(f"Failed to process {variable.item_name}")
         
+        success_count = len(processed)
+        self.selected_variables = processed
         print(f"\nProcessed {success_count}/{total_vars} variables successfully")
+        if success_count == total_vars:
+            self._store_cart(self.config.variables)
         return success_count > 0
 
-    def scrape(self) -> Union[str, Dict, pd.DataFrame]:
+    def _store_cart(self, variables: List[Variable]):
+        """Remember the variables in the site's cart in localStorage"""
+        try:
+            self.driver.execute_script(
+                "localStorage.setItem(arguments[0], JSON.stringify(arguments[1]));",
+                self.CART_STORAGE_KEY, [_variable_to_dict(v) for v in variables]
+            )
+        except Exception as e:
+            print(f"Could not store cart: {e}")
+
+    def _clear_cart(self):
+        """Forget the variables remembered in localStorage"""
+        try:
+            self.driver.execute_script("localStorage.removeItem(arguments[0]);", self.CART_STORAGE_KEY)
+        except Exception as e:
+            print(f"Could not clear stored cart: {e}")
+
+    def _is_cart_cached(self, variables: List[Variable]) -> bool:
+        """Check whether the cart stored in localStorage holds exactly these variables and the site's cart still does"""
+        try:
+            cached = self.driver.execute_script(
+                "return localStorage.getItem(arguments[0]);", self.CART_STORAGE_KEY
+            )
+            if cached is None or json.loads(cached) != [_variable_to_dict(v) for v in variables]:
+                return False
+        except Exception:
+            return False
+
+        # The site may have dropped the cart (e.g. an expired session), so confirm it on the page
+        if self._cart_count() != len(variables):
+            self._clear_cart()
+            return False
+        return True
+
+    def scrape(self) -> Union[str, Dict, "pd.DataFrame"]:
         """Main scraping process with automatic or interactive mode"""
         try:          
             var = []  # Initialize var list 
             
-            if not self.wait_for_element(By.CSS_SELECTOR,"h4.panel-title.serie-market-menu-category"):
+            if self.config.output_format.lower() in ["df", "dataframe"] and pd is None:
+                raise ImportError("pandas is required for dataframe output, "
+                                  "install it with: pip install evds-scraper[pandas]")
+
+            if not self.wait_for_element(SEL_CATEGORY_PANEL):
                 raise Exception("Page failed to load")
             
-            if self.config.variables:
+            if self.config.variables and self.pool_size > 1 and len(self.config.variables) > 1:
+                # Parallel automatic mode
+                if (self.config.output_format.lower() == "excel" or not self.config.is_date_mode_automatic()
+                        or pd is None):
+                    print("Parallel scraping needs pandas, configured dates and a dataframe or dict output, "
+                          "processing variables sequentially")
+                else:
+                    return self._scrape_in_parallel()
+
+            if self.config.variables and self._is_cart_cached(self.config.variables):
+                # The cart still holds these variables from a previous run
+                print("Variables already in cart, skipping selection")
+                self.selected_variables = list(self.config.variables)
+
+            elif self.config.variables:
                 # Automatic mode
                 if not self.process_variables_automatically():
                     raise Exception("Failed to process variables automatically")
@@ -443,7 +922,7 @@ class EVDSScraper:
                     item = self.select_item()
                     calculation_type = self.select_calculation_type()
                     self.add_to_cart()
-                    var.append([category, subcategory, item, calculation_type])
+                    var.append(Variable(category, subcategory, item, calculation_type))
                     if input("\nAdd more variables? (y/n): ").lower().strip() != 'y':
                         break
 
@@ -462,8 +941,7 @@ class EVDSScraper:
             if self.config.output_format.lower() == "excel":
                 return self.save_as_excel()
             else:                
-                table_data = self.parse_table(begin_date)
-                explanations = self.parse_explanations() if self.config.include_explanations else None            
+                table_data, explanations = self.parse_report(begin_date)
             
                 if self.config.output_format.lower() in ["df","dataframe"]:
                     df = pd.DataFrame(table_data)
@@ -482,11 +960,144 @@ class EVDSScraper:
             print(f"Error during scraping: {e}")
             raise
     
+    @classmethod
+    def build_driver(cls, headless: bool = True, block_images: bool = True, block_stylesheets: bool = False,
+                     performance_logging: bool = False, download_dir: Optional[str] = None):
+        """
+        Build a Chrome driver tuned for scraping
+
+        Args:
+            headless: Run Chrome without a window
+            block_images: Skip loading images, which the scraper never needs
+            block_stylesheets: Skip loading stylesheets as well. Faster, but the
+                site layout (and visibility based waits) may break.
+            performance_logging: Record network events, required by
+                ScraperConfig.use_data_endpoint
+            download_dir: Save downloads to this directory without prompting,
+                see ScraperConfig.download_dir
+        """
+        from selenium import webdriver
+
+        options = webdriver.ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+
+        prefs = {}
+        if block_images:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            prefs["profile.managed_default_content_settings.images"] = 2
+        if block_stylesheets:
+            prefs["profile.default_content_setting_values.stylesheet"] = 2
+        if download_dir:
+            prefs["download.default_directory"] = os.path.abspath(download_dir)
+            prefs["download.prompt_for_download"] = False
+        if prefs:
+            options.add_experimental_option("prefs", prefs)
+        if performance_logging:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        return webdriver.Chrome(options=options)
+
+    def _build_pool_driver(self):
+        """Build an additional driver for the session pool"""
+        return self.build_driver(performance_logging=self.config.use_data_endpoint,
+                                 download_dir=self.config.download_dir)
+
+    def _scrape_in_parallel(self) -> Union[Dict, "pd.DataFrame"]:
+        """Split config.variables over a pool of sessions and merge their tables on the date column"""
+        variables = self.config.variables
+        pool_size = min(self.pool_size, len(variables))
+        chunk_size = -(-len(variables) // pool_size)
+        chunks = [variables[i:i + chunk_size] for i in range(0, len(variables), chunk_size)]
+        worker_config = replace(self.config, output_format="dataframe")
+
+        def process_chunk(index: int, chunk: List[Variable]) -> Tuple[List[Variable], Optional["pd.DataFrame"]]:
+            # The first chunk reuses this scraper's driver, the others get their own session
+            driver = self.driver if index == 0 else self._build_pool_driver()
+            try:
+                worker = EVDSScraper(driver, replace(worker_config, variables=chunk))
+                frame = worker.scrape()
+                return worker.selected_variables, frame
+            except Exception as e:
+                print(f"Error processing variables {[v.item_name for v in chunk]}: {e}")
+                return [], None
+            finally:
+                if driver is not self.driver:
+                    driver.quit()
+
+        print(f"\nProcessing {len(variables)} variables with {len(chunks)} sessions")
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = list(executor.map(process_chunk, range(len(chunks)), chunks))
+
+        # Keep the variables each session actually added to its cart
+        succeeded = [(selected, frame) for selected, frame in results if frame is not None and not frame.empty]
+        if not succeeded:
+            raise Exception("Failed to process variables in parallel")
+        self.selected_variables = [variable for selected, _ in succeeded for variable in selected]
+        frames = [frame for _, frame in succeeded]
+
+        explanations = [e for frame in frames for e in frame.attrs.get('explanations', [])]
+        df = self._merge_frames(frames)
+
+        if self.config.output_format.lower() in ["df", "dataframe"]:
+            if explanations and self.config.include_explanations:
+                df.attrs['explanations'] = explanations
+            return df
+
+        result = {
+            "data": df.to_dict("records"),
+            "columns": list(df.columns)}
+        if explanations and self.config.include_explanations:
+            result["explanations"] = explanations
+        return result
+
+    @staticmethod
+    def _date_sort_key(date: str) -> Optional[Tuple[int, ...]]:
+        """Turn a grid date such as 31-12-2019, 03-2020, 2020-03 or Q1-2020 into a sortable tuple"""
+        tokens = re.findall(r'\d+', str(date))
+        years = [i for i, token in enumerate(tokens) if len(token) == 4]
+        if len(years) != 1:
+            return None
+        year = years[0]
+        # Parts before the year run from smallest to largest (DD-MM-YYYY), parts after it the other way
+        periods = [int(token) for token in reversed(tokens[:year])] + [int(token) for token in tokens[year + 1:]]
+        return (int(tokens[year]), *periods)
+
+    @staticmethod
+    def _merge_frames(frames: List["pd.DataFrame"]) -> "pd.DataFrame":
+        """Outer-merge session tables on their date column, keeping the grid's date order and string cells"""
+        # Align the date column name before merging
+        date_column = frames[0].columns[0]
+        frames = [frame.rename(columns={frame.columns[0]: date_column}) for frame in frames]
+        df = reduce(lambda left, right: left.merge(right, on=date_column, how="outer", sort=False), frames)
+
+        # Each session only returns the dates of its own variables, so neither the merge order nor
+        # the order dates are first seen in is the grid's. Sort by the parsed date instead, in the
+        # direction the sessions' grids use.
+        keys = [EVDSScraper._date_sort_key(date) for date in df[date_column]]
+        if None not in keys:
+            descending = False
+            for frame in frames:
+                frame_keys = [EVDSScraper._date_sort_key(date) for date in frame[date_column]]
+                if len(frame_keys) > 1 and frame_keys[0] != frame_keys[-1]:
+                    descending = frame_keys[0] > frame_keys[-1]
+                    break
+            order = sorted(range(len(keys)), key=keys.__getitem__, reverse=descending)
+            df = df.iloc[order].reset_index(drop=True)
+
+        # Dates a session didn't return show as empty cells, as in the grid
+        return df.fillna("")
+
     def select_frequency(self) -> str:
         """Select frequency based on config or interactive"""
         try:
-            frequency_select = self.wait_for_element(By.ID, "frekansSelect")
-            options = frequency_select.find_elements(By.TAG_NAME, "option")
+            frequency_select = self.wait_for_element(SEL_FREQUENCY)
+            options = self.driver.execute_script(SELECT_OPTIONS_JS, frequency_select)
+            values = [value for value, _ in options]
+            begin_label = self.wait_for_element(SEL_BEGIN_DATE_LABEL)
+            previous_label = begin_label.get_property('textContent') if begin_label else None
 
             if self.config.frequency:
                 # Automatic mode
@@ -496,50 +1107,56 @@ class EVDSScraper:
                     raise ValueError(f"Invalid frequency '{self.config.frequency}'. Available options are: {available_freqs}")
 
                 # Check if frequency exists in dropdown
-                available_values = [opt.get_attribute('value') for opt in options]
-                if freq_value not in available_values:
-                    raise ValueError(f"Frequency '{freq_value}' not available in dropdown. Available values: {', '.join(available_values)}")
-
-                for option in options:
-                    if option.get_attribute('value') == freq_value:
-                        self.driver.execute_script(
-                            "arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('change'));",
-                            frequency_select, freq_value
-                        )
-                        print(f"\nSelected frequency: {option.text}")
-                        time.sleep(1)
-                        return option.text
-
-            # Interactive mode
-            print("\nAvailable Frequencies:")
-            for i, opt in enumerate(options, 1):
-                print(f"{i}. {opt.text} ({opt.get_attribute('value')})")
-
-            choice = self.get_user_choice(len(options))
-            selected = options[choice - 1]
-            self.driver.execute_script(
-                "arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('change'));",
-                frequency_select, selected.get_attribute('value')
-            )
-            print(f"\nSelected frequency: {selected.text}")
-            time.sleep(1)
-            return selected.text
+                if freq_value not in values:
+                    raise ValueError(f"Frequency '{freq_value}' not available in dropdown. Available values: {', '.join(values)}")
+                value, text = options[values.index(freq_value)]
+
+            else:
+                # Interactive mode
+                print("\nAvailable Frequencies:")
+                for i, (value, text) in enumerate(options, 1):
+                    print(f"{i}. {text} ({value})")
+
+                choice = self.get_user_choice(len(options))
+                value, text = options[choice - 1]
+
+            # Re-selecting the current frequency doesn't refresh the date labels, skip waiting for it
+            if frequency_select.get_property('value') != value:
+                self.driver.execute_script(SET_SELECT_VALUE_JS, frequency_select, value)
+                self._wait_for_date_labels(previous_label)
+            print(f"\nSelected frequency: {text}")
+            return text
 
         except Exception as e:
             print(f"Error selecting frequency: {e}")
             raise
 
+    def _wait_for_date_labels(self, previous_label: Optional[str], timeout: int = 2):
+        """Wait for the available date range labels to refresh after a frequency change"""
+        if previous_label is None:
+            return
+        # Labels stay the same when the new frequency shares the old range, so don't fail on timeout
+        self.wait_for_condition(
+            lambda d: d.find_element(*SEL_BEGIN_DATE_LABEL).get_property('textContent') != previous_label,
+            timeout
+        )
+
     def get_date_format_by_frequency(self, frequency: str) -> str:
         """Get the required date format based on frequency"""
         format_example = self.DATE_FORMATS.get(frequency, "MM-YYYY")
         print(f"\nRequired date format: {format_example}")
         return format_example
+
+    def validate_date(self, frequency: str, date: str) -> bool:
+        """Check a date string against the format required by the frequency"""
+        pattern = self._DATE_REGEXES.get(frequency)
+        return pattern is None or bool(pattern.match(date))
     
     def get_available_dates(self) -> tuple:
         """Get the available date range from labels"""
         try:
-            begin_label = self.wait_for_element(By.ID, "beginDateLabel")
-            end_label = self.wait_for_element(By.ID, "endDateLabel")
+            begin_label = self.wait_for_element(SEL_BEGIN_DATE_LABEL)
+            end_label = self.wait_for_element(SEL_END_DATE_LABEL)
 
             begin_date = begin_label.text.strip("()")
             end_date = end_label.text.strip("()")
@@ -556,7 +1173,9 @@ class EVDSScraper:
             self.safe_click(element)
             element.send_keys(Keys.CONTROL + "a")  # Select all
             element.send_keys(Keys.DELETE)  # Delete selection
-            time.sleep(0.5)  # Wait for field to clear
+            self.wait_for_condition(
+                lambda d: d.execute_script("return arguments[0].value === '';", element), 1
+            )
         except Exception as e:
             print(f"Error clearing field: {e}")
 
@@ -564,33 +1183,45 @@ class EVDSScraper:
         """Set date range with validation"""
         try:
             # Get current frequency for format validation
-            freq_select = self.wait_for_element(By.ID, "frekansSelect")
+            freq_select = self.wait_for_element(SEL_FREQUENCY)
             current_frequency = freq_select.get_attribute("value")
             
             if self.config.is_date_mode_automatic():
                 begin_date = self.config.begin_date
                 end_date = self.config.end_date
                 print(f"\nUsing configured dates: {begin_date} to {end_date}")
+                for date in (begin_date, end_date):
+                    if not self.validate_date(current_frequency, date):
+                        raise ValueError(f"Invalid date '{date}'. Required format: {self.DATE_FORMATS[current_frequency]}")
             else:
                 # Get available date range
                 available_begin, available_end = self.get_available_dates()
 
                 date_format = self.get_date_format_by_frequency(current_frequency)
                 print(f"\nEnter dates in format: {date_format}")
-                begin_date = input("Begin date: ").strip()
-                end_date = input("End date: ").strip()
+                while True:
+                    begin_date = input("Begin date: ").strip()
+                    end_date = input("End date: ").strip()
+                    if self.validate_date(current_frequency, begin_date) and \
+                    self.validate_date(current_frequency, end_date):
+                        break
+                    print(f"Please enter dates in format: {date_format}")
 
             # Set begin date
-            begin_elem = self.wait_for_element(By.ID, "beginDate")
+            begin_elem = self.wait_for_element(SEL_BEGIN_DATE)
             self.clear_input_field(begin_elem)
             begin_elem.send_keys(begin_date)
-            time.sleep(0.5)
+            self.wait_for_condition(
+                EC.text_to_be_present_in_element_value(SEL_BEGIN_DATE, begin_date), 1
+            )
 
             # Set end date
-            end_elem = self.wait_for_element(By.ID, "endDate")
+            end_elem = self.wait_for_element(SEL_END_DATE)
             self.clear_input_field(end_elem)
             end_elem.send_keys(end_date)
-            time.sleep(0.5)
+            self.wait_for_condition(
+                EC.text_to_be_present_in_element_value(SEL_END_DATE, end_date), 1
+            )
 
             return begin_date, end_date
 
@@ -605,206 +1236,410 @@ class EVDSScraper:
             begin_date: The target beginning date to scroll to
         """
         try:
-            # Prepare alternative date format if there's only one hyphen
-            alternative_date = None
-            if begin_date.count('-') == 1:
-                # Split and swap parts around the hyphen
-                month, year = begin_date.split('-')
-                alternative_date = f"{year}-{month}"
-
+            alternative_date = self._get_alternative_date(begin_date)
+            self._wait_for_grid()
 
-            # Wait for table content to load
-            self.wait_for_element(By.CLASS_NAME, "dx-datagrid-content")
+            # Harvest the whole grid inside the browser in one round trip
+            try:
+                grid = self._harvest_report(begin_date, alternative_date)
+            except Exception as e:
+                print(f"Grid harvesting failed, falling back to scrolling: {e}")
+                return self._scroll_and_parse_table(begin_date, alternative_date)
 
-            # Get headers
-            headers = self.wait_for_elements(
-                By.CSS_SELECTOR, 
-                "td[role='columnheader'] .dx-datagrid-text-content"
-            )
-            column_names = [header.text.strip() for header in headers]
+            return self._grid_to_rows(grid)
 
-            # Find scroll container
-            scroll_container = self.wait_for_element(
-                By.CSS_SELECTOR, 
-                "div.dx-scrollable-container"
-            )
+        except Exception as e:
+            print(f"Error parsing table: {e}")
+            return {"columns": [], "data": [], "row_count": 0}
 
-            processed_rows = set()
-            data = []
-            found_begin_date = False
-
-            while not found_begin_date:
-                # Get current visible rows
-                rows = self.wait_for_elements(
-                    By.CSS_SELECTOR, 
-                    "tr.dx-row.dx-data-row"
-                )
-
-                for row in rows:
-                    try:
-                        cells = row.find_elements(By.TAG_NAME, "td")
-                        if not cells:
-                            continue
-
-                        row_date = cells[0].text.strip()
-
-                        if row_date and row_date not in processed_rows:
-                            if len(cells) >= len(column_names):
-                                row_data = {}
-                                for idx, cell in enumerate(cells):
-                                    if idx < len(column_names):
-                                        row_data[column_names[idx]] = cell.text.strip()
-                                data.append(row_data)
-
-
-                                # Check both date formats
-                                if row_date == begin_date or (alternative_date and row_date == alternative_date):
-                                    print(f"Found matching date: {row_date}")
-                                    found_begin_date = True
-                                    break
-
-                    except Exception as e:
-                        print(f"Error parsing row: {e}")
-                        continue
+    def parse_report(self, begin_date: str) -> Tuple[Any, Optional[List[Dict[str, str]]]]:
+        """
+        Parse the data table and, if configured, the explanations in one round trip
+        Args:
+            begin_date: The target beginning date to scroll to
+        Returns:
+            tuple: Table data and explanations (None when explanations are not included)
+        """
+        if self.config.use_data_endpoint:
+            # The grid renders once its data request has finished, so its body is readable by then
+            self._wait_for_grid()
+            data = self._fetch_report_data()
+            if data:
+                print(f"\nRead {len(data)} rows from the report data endpoint")
+                return data, self.parse_explanations() if self.config.include_explanations else None
+            print("Report data endpoint not found or not matching the grid, reading the grid instead")
+
+        if not self.config.include_explanations:
+            return self.parse_table(begin_date), None
 
-                if not found_begin_date:
-                    self.driver.execute_script(
-                        "arguments[0].scrollTop += 100",
-                        scroll_container
-                    )
-                    time.sleep(0.5)
+        try:
+            alternative_date = self._get_alternative_date(begin_date)
+            self._wait_for_grid()
+            self.wait_for_elements(SEL_EXPLANATION_SECTIONS)
+            report = self._harvest_report(begin_date, alternative_date, with_explanations=True)
+        except Exception as e:
+            print(f"Report harvesting failed, parsing table and explanations separately: {e}")
+            return self.parse_table(begin_date), self.parse_explanations()
 
-            print(f"\nParsed {len(data)} rows with {len(column_names)} columns")
-            return data
+        return self._grid_to_rows(report), self._format_explanations(report['explanations'])
 
+    def _drain_performance_log(self):
+        """Discard the performance log recorded so far, so only report responses are searched later"""
+        try:
+            self.driver.get_log("performance")
         except Exception as e:
-            print(f"Error parsing table: {e}")
-            return {"columns": [], "data": [], "row_count": 0}
+            print(f"Performance log unavailable: {e}")
 
-    def parse_explanations(self) -> List[Dict[str, str]]:
-        """Parse the explanation section with improved error handling"""
+    def _fetch_report_data(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read the report rows from the JSON XHR/fetch responses recorded in the performance log.
+        create_report drains the log before clicking, so only responses to the report are searched,
+        and only records matching the rendered grid are accepted.
+        """
         try:
-            # Wait for explanation tab
-            self.wait_for_element(By.ID, "tab_6_1_")
-            time.sleep(1)  # Wait for content to load
-
-            # Get all variable sections
-            var_sections = self.wait_for_elements(
-                By.CSS_SELECTOR,
-                "#tab_6_1_ .col-md-12"
-            )
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            print(f"Performance log unavailable: {e}")
+            return None
 
-            explanations = []
-            for section in var_sections:
+        request_ids = []
+        for entry in entries:
+            message = json.loads(entry["message"]).get("message", {})
+            if message.get("method") != "Network.responseReceived":
+                continue
+            params = message["params"]
+            if params.get("type") in ("XHR", "Fetch") and "json" in params["response"].get("mimeType", ""):
+                request_ids.append(params["requestId"])
+
+        # The grid data is the largest list of records among the JSON responses that matches the grid
+        headers = self.driver.execute_script(COLLECT_TEXTS_JS, SEL_HEADERS[1])
+        total_count = self.driver.execute_script(GRID_TOTAL_COUNT_JS, SEL_GRID[1])
+        records = None
+        for request_id in request_ids:
+            try:
+                response = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                body = response["body"]
+                if response.get("base64Encoded"):
+                    body = base64.b64decode(body)
+                candidate = self._find_records(json.loads(body))
+            except Exception:
+                continue
+            if not candidate or not self._records_match_grid(candidate, headers, total_count):
+                continue
+            if records is None or len(candidate) > len(records):
+                records = candidate
+        return records
+
+    @staticmethod
+    def _records_match_grid(records: List[Dict[str, Any]], headers: List[str], total_count: Optional[int]) -> bool:
+        """Check that endpoint records carry the grid's columns, by key names or by the row and column counts"""
+        def normalize(name: Any) -> str:
+            return re.sub(r'[\W_]+', '', str(name)).lower()
+
+        keys = {normalize(key) for key in records[0]}
+        if headers and {normalize(header) for header in headers} <= keys:
+            return True
+        # Raw keys often differ from the grid labels, so fall back to the grid's own row count
+        return total_count is not None and len(records) == total_count and len(keys) >= len(headers)
+
+    @staticmethod
+    def _find_records(payload: Any) -> Optional[List[Dict[str, Any]]]:
+        """Find the largest list of objects in a JSON payload"""
+        if isinstance(payload, list):
+            if payload and all(isinstance(record, dict) for record in payload):
+                return payload
+            return None
+        if isinstance(payload, dict):
+            candidates = [EVDSScraper._find_records(value) for value in payload.values()]
+            candidates = [candidate for candidate in candidates if candidate]
+            return max(candidates, key=len) if candidates else None
+        return None
+
+    @staticmethod
+    def _get_alternative_date(begin_date: str) -> Optional[str]:
+        """Prepare alternative date format if there's only one hyphen"""
+        if begin_date.count('-') != 1:
+            return None
+        # Split and swap parts around the hyphen
+        month, year = begin_date.split('-')
+        return f"{year}-{month}"
+
+    def _wait_for_grid(self):
+        """Wait for table content to load"""
+        self.wait_for_element(SEL_GRID_CONTENT)
+        self.wait_for_elements(SEL_HEADERS)
+        self.wait_for_element(SEL_ROWS)
+
+    def _harvest_report(self, begin_date: str, alternative_date: Optional[str],
+                        with_explanations: bool = False) -> Dict[str, Any]:
+        """Run the in-browser report harvester"""
+        self.driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+        return self.driver.execute_async_script(
+            HARVEST_REPORT_JS,
+            begin_date,
+            alternative_date,
+            EXPLANATION_SELECTORS if with_explanations else None,
+            GRID_SELECTORS
+        )
+
+    def _grid_to_rows(self, grid: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Convert harvested grid columns and rows into row dictionaries"""
+        column_names = grid['columns']
+        data = [dict(zip(column_names, cells)) for cells in grid['rows']]
+        if grid['found']:
+            print(f"Found matching date: {grid['rows'][-1][0]}")
+
+        print(f"\nParsed {len(data)} rows with {len(column_names)} columns")
+        return data
+
+    def _scroll_and_parse_table(self, begin_date: str, alternative_date: Optional[str]) -> List[Dict[str, str]]:
+        """Parse the data table by scrolling it from Python, one batch of rows at a time"""
+        column_names = self.driver.execute_script(COLLECT_TEXTS_JS, SEL_HEADERS[1])
+
+        # Find scroll container
+        scroll_container = self.wait_for_element(SEL_SCROLL_CONTAINER)
+
+        processed_rows = set()
+        data = []
+        found_begin_date = False
+        last_top = -1
+        stalls = 0
+
+        # Bind lookups used on every iteration to locals
+        wait_for_elements = self.wait_for_elements
+        execute_script = self.driver.execute_script
+        add_processed = processed_rows.add
+        append_row = data.append
+        rows_selector = SEL_ROWS[1]
+        scroll_script = "arguments[0].scrollTop += 100; return arguments[0].scrollTop;"
+        column_count = len(column_names)
+
+        while not found_begin_date:
+            # Get current visible rows
+            wait_for_elements(SEL_ROWS)
+            rows = execute_script(COLLECT_CELLS_JS, rows_selector)
+
+            for row_index, cells in rows:
                 try:
-                    # Get code
-                    code_elem = section.find_element(
-                        By.CSS_SELECTOR,
-                        ".col-md-4 h6 p"
-                    )
-                    code = code_elem.text.strip()
-
-                    # Get description and calculation type
-                    desc_container = section.find_element(
-                        By.CSS_SELECTOR,
-                        ".col-md-4:nth-child(2) h6"
-                    )
-                    desc_elem = desc_container.find_element(By.CSS_SELECTOR, "p")
-                    desc_text = desc_elem.text.strip()
-                    
-                    # Get additional info
-                    info_div = desc_container.find_element(By.CSS_SELECTOR, "div[id^='infoD_']")
-                    additional_info = info_div.text.strip()
-
-                    # Split description into parts
-                    desc_parts = desc_text.split("-")
-                    main_desc = desc_parts[0].strip()
-                    calc_type = desc_parts[-1].strip() if len(desc_parts) > 1 else ""
-
-                    # Create explanation entry
-                    explanation = {
-                        "code": code,
-                        "description": main_desc,
-                        "calculation_type": calc_type.strip("<i>").strip("</i>"),
-                        "additional_info": additional_info
-                    }
-                    explanations.append(explanation)
+                    if not cells:
+                        continue
+
+                    row_date = cells[0]
+                    row_key = row_date if row_index is None else row_index
+
+                    if row_date and row_key not in processed_rows:
+                        if len(cells) >= column_count:
+                            add_processed(row_key)
+                            append_row(dict(zip(column_names, cells)))
+
+
+                            # Check both date formats
+                            if row_date == begin_date or (alternative_date and row_date == alternative_date):
+                                print(f"Found matching date: {row_date}")
+                                found_begin_date = True
+                                break
 
                 except Exception as e:
-                    print(f"Error parsing explanation section: {e}")
+                    print(f"Error parsing row: {e}")
                     continue
 
-            print(f"\nParsed {len(explanations)} variable explanations")
-            return explanations
+            if not found_begin_date:
+                new_top = execute_script(scroll_script, scroll_container)
+                # Stop when the grid no longer scrolls, e.g. begin date is before its first row
+                if new_top == last_top:
+                    stalls += 1
+                    if stalls >= 2:
+                        print(f"Reached the end of the table without finding {begin_date}")
+                        break
+                else:
+                    stalls = 0
+                last_top = new_top
+                time.sleep(0.5)
+
+        print(f"\nParsed {len(data)} rows with {len(column_names)} columns")
+        return data
+
+    def parse_explanations(self) -> List[Dict[str, str]]:
+        """Parse the explanation section with improved error handling"""
+        try:
+            # Wait for explanation tab and its content
+            self.wait_for_element(SEL_EXPLANATIONS_TAB)
+            self.wait_for_elements(SEL_EXPLANATION_SECTIONS)
+
+            # Get all variable sections in one round trip
+            sections = self.driver.execute_script(COLLECT_EXPLANATIONS_JS, *EXPLANATION_SELECTORS)
+            return self._format_explanations(sections)
 
         except Exception as e:
             print(f"Error parsing explanations: {e}")
             return []
 
+    def _format_explanations(self, sections: List[Optional[Dict[str, str]]]) -> List[Dict[str, str]]:
+        """Build explanation entries from the raw sections read in the browser"""
+        explanations = []
+        for section in sections:
+            if not section:
+                print("Error parsing explanation section: missing code, description or info")
+                continue
+            explanations.append(self._format_explanation(section))
+
+        print(f"\nParsed {len(explanations)} variable explanations")
+        return explanations
+
+    def _format_explanation(self, section: Dict[str, str]) -> Dict[str, str]:
+        """Build an explanation entry from the raw texts of an explanation section"""
+        # Split description into parts
+        desc_parts = section['description'].split("-")
+        main_desc = desc_parts[0].strip()
+        calc_type = desc_parts[-1].strip() if len(desc_parts) > 1 else ""
+
+        return {
+            "code": section['code'],
+            "description": main_desc,
+            "calculation_type": calc_type.strip("<i>").strip("</i>"),
+            "additional_info": section['info']
+        }
+
     def save_as_excel(self) -> bool:
         """Export data to Excel"""
         try:
             # Find and click Excel button
-            excel_button = self.wait_for_element(
-                By.CSS_SELECTOR,
-                "div#excelButton_"
-            )
+            excel_button = self.wait_for_element(SEL_EXCEL_BUTTON)
             self.safe_click(excel_button)
-            time.sleep(1)
 
             # Find and click download button
-            download_button = self.wait_for_element(
-                By.ID, 
-                "evdsDscModalButtonDownload"
-            )
+            download_dir = self.config.download_dir
+            existing = set(glob.glob(os.path.join(download_dir, "*.xlsx"))) if download_dir else set()
+            download_button = self.export_wait.until(EC.element_to_be_clickable(SEL_DOWNLOAD_BUTTON))
             self.safe_click(download_button)
-            time.sleep(2)  # Wait for download to start
-
-            print("\nExcel export completed")
+            if download_dir:
+                downloaded = self._wait_for_download(download_dir, existing)
+                if downloaded is None:
+                    logger.warning("Download did not finish in time")
+                    return False
+                logger.info("Excel export completed: %s", downloaded)
+            else:
+                time.sleep(2)  # Wait for download to start
+                logger.info("Excel export completed")
             return True
 
-        except Exception as e:
-            print(f"Error exporting to Excel: {e}")
+        except Exception:
+            logger.exception("Error exporting to Excel")
             return False
 
-    
-    def export_configuration(self, filepath: str) -> bool:
+    @staticmethod
+    def _wait_for_download(dir_path: str, existing=(), timeout: float = 30, poll: float = 0.1) -> Optional[str]:
+        """Wait until a new .xlsx file is in dir_path and no download is still in progress, return its path"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not glob.glob(os.path.join(dir_path, "*.crdownload")):
+                new_files = [path for path in glob.glob(os.path.join(dir_path, "*.xlsx")) if path not in existing]
+                if new_files:
+                    return new_files[0]
+            time.sleep(poll)
+        return None
+
+    def _iter_selected_variables(self) -> Iterator[Variable]:
+        """Yield selected variables as Variable, converting legacy 4-item lists and skipping malformed entries"""
+        for var in self.selected_variables:
+            if isinstance(var, Variable):
+                yield var
+                continue
+            # Strings and mappings unpack too, into characters and keys
+            if isinstance(var, (str, bytes, Mapping)):
+                continue
+            try:
+                category, subcategory, item_name, calculation_type = var
+            except (TypeError, ValueError):
+                continue
+            yield Variable(category, subcategory, item_name, calculation_type)
+
+    def _iter_config_chunks(self, pretty: bool = False) -> Iterator[bytes]:
+        """Encode the exported configuration piece by piece, one selected variable at a time"""
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            encode = lambda obj: orjson.dumps(obj, option=option)
+        elif pretty:
+            encode = lambda obj: json.dumps(obj, indent=2).encode('utf-8')
+        else:
+            encode = lambda obj: json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+        # Frame the document by hand so the variables list is never built in full,
+        # matching the layout of encoding the whole dict at once
+        lang = self.config.language
+        if pretty:
+            yield b'{\n  "language": ' + encode(lang) + b',\n  "variables": ['
+            separator, indent = b',\n    ', b'\n    '
+        else:
+            yield b'{"language":' + encode(lang) + b',"variables":['
+            separator, indent = b',', b''
+
+        first = True
+        for var in self._iter_selected_variables():
+            chunk = encode(_variable_to_dict(var))
+            if pretty:
+                chunk = chunk.replace(b'\n', indent)
+            yield (indent if first else separator) + chunk
+            first = False
+
+        if pretty and not first:
+            yield b'\n  ]\n}\n'
+        elif pretty:
+            yield b']\n}\n'
+        else:
+            yield b']}\n'
+
+    def config_to_bytes(self, pretty: bool = False) -> bytes:
+        """
+        Encode current configuration and selected variables as UTF-8 JSON
+
+        Args:
+            pretty (bool): Indent the JSON for human reading instead of encoding it compact
+        Returns:
+            bytes: The JSON document, ending with a newline
+        """
+        return b''.join(self._iter_config_chunks(pretty))
+
+    def export_configuration(self, filepath: str, pretty: bool = False) -> bool:
         """
         Export current configuration and selected variables to a JSON file
 
         Args:
             filepath (str): Path where the configuration file will be saved
+            pretty (bool): Indent the JSON for human reading instead of writing it compact
         Returns:
             bool: True if export successful, False otherwise
         """
+        if not self.selected_variables:
+            logger.warning("No variables selected, nothing to export")
+            return False
+
         try:
-            # Add .json extension if missing
-            if not filepath.endswith('.json'):
+            # Add .json extension if missing, in any case
+            filepath = os.fspath(filepath)
+            if PurePath(filepath).suffix.lower() != '.json':
                 filepath += '.json'
 
-            # Create basic config dictionary
-            config_dict = {
-                "language": self.config.language,
-                "variables": []
-            }
-
-            # Add selected variables
-            for var in self.selected_variables:
-                if isinstance(var, list) and len(var) == 4:
-                    config_dict["variables"].append({
-                        "category": var[0],
-                        "subcategory": var[1],
-                        "item_name": var[2],
-                        "calculation_type": var[3]
-                    })
-
-            # Save to file
-            with open(filepath, 'w') as f:
-                json.dump(config_dict, f, indent=2)
-
-            print(f"Configuration saved to: {filepath}")
+            # Stream to a uniquely named temporary file next to the target through one
+            # buffer, so the many small chunks coalesce into few writes and concurrent
+            # exports or existing files are never clobbered
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(filepath) or '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb', buffering=0) as raw, \
+                        io.BufferedWriter(raw, buffer_size=self.EXPORT_BUFFER_SIZE) as f:
+                    for chunk in self._iter_config_chunks(pretty):
+                        f.write(chunk)
+
+                # Move it into place so an interrupted write never leaves a partial file
+                os.replace(tmp_path, filepath)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+            logger.info("Configuration saved to: %s", filepath)
             return True
 
-        except Exception as e:
-            print(f"Error saving configuration: {e}")
+        except Exception:
+            logger.exception("Error saving configuration")
             return False
\ No newline at end of file
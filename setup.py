@@ -3,9 +3,6 @@ from setuptools import setup, find_packages
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
-
-from setuptools import setup, find_packages
-
 setup(
     name="evds-scraper",
     version="0.1.0",
@@ -15,6 +12,8 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/ozanoztrk/evds-scraper",
     packages=find_packages(),
+    include_package_data=True,
+    zip_safe=False,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -28,6 +27,12 @@ setup(
     python_requires=">=3.7",
     install_requires=[
         "selenium>=4.0.0",
-        "pandas>=1.0.0",
-    ]
+    ],
+    extras_require={
+        "pandas": [
+            "pandas>=1.5.0; python_version >= '3.8'",
+            "pandas>=1.0.0; python_version < '3.8'",
+        ],
+        "fast-json": ["orjson>=3.10.0; python_version >= '3.8'"],
+    },
 )
\ No newline at end of file
@@ -0,0 +1,39 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from evds_scraper.scraper import EVDSScraper
+
+
+def test_merge_frames_orders_rows_by_date():
+    left = pd.DataFrame({"Date": ["12-2019", "01-2020", "03-2020"], "A": ["1", "2", "3"]})
+    right = pd.DataFrame({"Tarih": ["12-2019", "03-2020", "02-2020"], "B": ["4", "5", "6"]})
+
+    df = EVDSScraper._merge_frames([left, right])
+
+    assert list(df.columns) == ["Date", "A", "B"]
+    assert list(df["Date"]) == ["12-2019", "01-2020", "02-2020", "03-2020"]
+    assert list(df["A"]) == ["1", "2", "", "3"]
+    assert list(df["B"]) == ["4", "", "6", "5"]
+
+
+def test_merge_frames_keeps_descending_grids_descending():
+    left = pd.DataFrame({"Date": ["03-2020", "02-2020", "01-2020"], "A": ["3", "2", "1"]})
+    right = pd.DataFrame({"Date": ["03-2020", "12-2019"], "B": ["5", "4"]})
+
+    df = EVDSScraper._merge_frames([left, right])
+
+    assert list(df["Date"]) == ["03-2020", "02-2020", "01-2020", "12-2019"]
+    assert list(df["B"]) == ["5", "", "", "4"]
+
+
+@pytest.mark.parametrize("date, key", [
+    ("31-12-2019", (2019, 12, 31)),
+    ("03-2020", (2020, 3)),
+    ("2020-03", (2020, 3)),
+    ("Q1-2020", (2020, 1)),
+    ("2020", (2020,)),
+    ("Total", None),
+])
+def test_date_sort_key(date, key):
+    assert EVDSScraper._date_sort_key(date) == key